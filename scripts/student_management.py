@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import messagebox, ttk, simpledialog
 import sqlite3
 import datetime
+import itertools
 import os
 from fpdf import FPDF
 from google.oauth2.credentials import Credentials
@@ -80,6 +81,197 @@ def load_credentials():
     except FileNotFoundError:
         return None
 
+# Invoice PDF template: the school header and column headings are rendered once
+# and stamped onto every invoice, each invoice only draws its own rows.
+# Stamping and row drawing write page content directly, which relies on fpdf 1.7.2 internals
+class InvoicePDF(FPDF):
+    SCHOOL_NAME = "DoReMi Music School"
+    SCHOOL_LINES = ("302 Satellite Blvd NE, Ste#C225, Suwanee, GA 30024",
+                    "404-917-3348 | www.doremimusic.net")
+    COLUMNS = (("Student", 40), ("Date", 30), ("Qty", 20), ("Rate", 30), ("Amount", 30), ("Description", 40))
+    COLUMN_WIDTHS = tuple(width for _, width in COLUMNS)
+    COLUMN_OFFSETS = (0,) + tuple(itertools.accumulate(COLUMN_WIDTHS[:-1]))
+    TABLE_WIDTH = sum(COLUMN_WIDTHS)
+    LINE_HEIGHT = 10
+    ROW_HEIGHT = 8
+    WRAPPED_LINE_HEIGHT = 5
+
+    # Rendered page content by (part, registered fonts, position, font), shared by every invoice.
+    # fpdf 1.7.2 keeps a page's content as a plain string, so a part drawn once
+    # can be appended as-is to later pages
+    stamps = {}
+    # Widths of single words and characters per font, shared by the invoices of one batch
+    word_widths = {}
+
+    def __init__(self):
+        super().__init__()
+        self.set_margins(10, 10)
+        self.set_auto_page_break(True, margin=15)
+        # Register the fonts in a fixed order so stamped content refers to the same font resources
+        self.set_font("Arial", 'B', 16)
+        self.set_font("Arial", size=12)
+        self.in_table = False
+        self.table_top = 0
+
+    def stamp(self, name, draw):
+        page = self.pages[self.page]
+        fonts = tuple(self.fonts)
+        key = (name, fonts, self.x, self.y, self.font_family, self.font_style, self.font_size_pt)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            start = len(page)
+            draw()
+            # Stamped content refers to fonts by resource number, so it must not register new ones
+            assert tuple(self.fonts) == fonts, f"stamped part {name!r} uses a font not registered in __init__"
+            self.stamps[key] = (self.pages[self.page][start:], self.x, self.y, self.lasth,
+                                self.font_family, self.font_style, self.font_size_pt)
+            return
+        content, self.x, self.y, self.lasth, family, style, size = stamp
+        self.pages[self.page] = page + content
+        self.set_font(family, style, size)
+
+    def header(self):
+        # Called by fpdf on every new page, so continuation pages get the table header too
+        if self.page_no() == 1:
+            self.stamp("school", self.school_header)
+        if self.in_table:
+            self.table_header()
+
+    def footer(self):
+        if self.in_table:
+            self.close_table_block()
+
+    def school_header(self):
+        self.set_font("Arial", 'B', 16)
+        self.cell(0, self.LINE_HEIGHT, txt=self.SCHOOL_NAME, ln=True, align='C')
+        self.set_font("Arial", size=12)
+        for line in self.SCHOOL_LINES:
+            self.cell(0, self.LINE_HEIGHT, txt=line, ln=True, align='C')
+        self.ln(10)
+
+    def table_header(self):
+        self.table_top = self.get_y()
+        self.stamp("columns", self.column_headings)
+
+    def column_headings(self):
+        self.draw_row([[label] for label, _ in self.COLUMNS], self.LINE_HEIGHT, self.LINE_HEIGHT)
+
+    def close_table_block(self):
+        # Column rules are drawn once per page instead of a box around every cell
+        bottom = self.get_y()
+        x = self.l_margin
+        self.line(x, self.table_top, x, bottom)
+        for width in self.COLUMN_WIDTHS:
+            x += width
+            self.line(x, self.table_top, x, bottom)
+
+    def start_table(self, first_row=None):
+        # Keep the column headings together with the first row. A row taller than a page
+        # is split anyway, so then only its first line has to fit
+        height = self.row_height(self.wrap_row(first_row)) if first_row else self.ROW_HEIGHT
+        if height > self.page_room():
+            height = self.ROW_HEIGHT
+        if self.get_y() + self.LINE_HEIGHT + height > self.page_break_trigger:
+            self.add_page()
+        self.in_table = True
+        self.table_header()
+
+    def end_table(self):
+        self.close_table_block()
+        self.in_table = False
+
+    def font_widths(self):
+        return self.word_widths.setdefault((self.font_family, self.font_style, self.font_size_pt), {})
+
+    def text_width(self, text, widths):
+        width = widths.get(text)
+        if width is None:
+            width = widths[text] = self.get_string_width(text)
+        return width
+
+    def wrap_text(self, text, width, widths):
+        width -= 2 * self.c_margin
+        space_width = self.text_width(" ", widths)
+        lines = []
+        current = ""
+        current_width = 0
+        for word in text.split():
+            word_width = self.text_width(word, widths)
+            if current and current_width + space_width + word_width <= width:
+                current += " " + word
+                current_width += space_width + word_width
+                continue
+            if current:
+                lines.append(current)
+            if word_width <= width:
+                current = word
+                current_width = word_width
+                continue
+            # Break words that are wider than the column on their own
+            current = ""
+            current_width = 0
+            for char in word:
+                char_width = self.text_width(char, widths)
+                if current and current_width + char_width > width:
+                    lines.append(current)
+                    current = ""
+                    current_width = 0
+                current += char
+                current_width += char_width
+        lines.append(current)
+        return lines
+
+    def draw_row(self, wrapped, height, line_height):
+        y = self.get_y()
+        right = self.l_margin + self.TABLE_WIDTH
+        if y == self.table_top:
+            self.line(self.l_margin, y, right, y)
+        # One text object per row with relative moves, fpdf's text() opens one per line
+        k = self.k
+        leading = round(line_height * k, 2)
+        top = (self.h - y - 0.3 * self.font_size) * k
+        ops = ["BT %.2f TL" % leading]
+        line_x = line_y = 0
+        for lines, offset in zip(wrapped, self.COLUMN_OFFSETS):
+            if lines:
+                cell_x = (self.l_margin + offset + self.c_margin) * k
+                cell_y = top - 0.5 * (height if len(lines) == 1 else line_height) * k
+                text = self._escape("\n".join(lines)).replace("\n", ") Tj T* (")
+                ops.append("%.2f %.2f Td (%s) Tj" % (cell_x - line_x, cell_y - line_y, text))
+                line_x = cell_x
+                line_y = cell_y - (len(lines) - 1) * leading
+        ops.append("ET")
+        self._out(" ".join(ops))
+        self.line(self.l_margin, y + height, right, y + height)
+        self.set_xy(self.l_margin, y + height)
+
+    def wrap_row(self, values):
+        widths = self.font_widths()
+        return [self.wrap_text(str(value), width, widths) for value, width in zip(values, self.COLUMN_WIDTHS)]
+
+    def row_height(self, wrapped):
+        return max(self.ROW_HEIGHT, max(len(lines) for lines in wrapped) * self.WRAPPED_LINE_HEIGHT)
+
+    def page_room(self):
+        # Height available for rows below the column headings on a fresh page
+        return self.page_break_trigger - self.t_margin - self.LINE_HEIGHT
+
+    def add_row(self, values):
+        wrapped = self.wrap_row(values)
+        height = self.row_height(wrapped)
+        if self.get_y() + height > self.page_break_trigger and height <= self.page_room():
+            self.add_page()
+        # Rows taller than a whole page carry their remaining lines onto the next pages
+        while self.get_y() + height > self.page_break_trigger:
+            fit = int((self.page_break_trigger - self.get_y()) / self.WRAPPED_LINE_HEIGHT)
+            if fit:
+                self.draw_row([lines[:fit] for lines in wrapped], fit * self.WRAPPED_LINE_HEIGHT,
+                              self.WRAPPED_LINE_HEIGHT)
+                wrapped = [lines[fit:] for lines in wrapped]
+                height = self.row_height(wrapped)
+            self.add_page()
+        self.draw_row(wrapped, height, self.WRAPPED_LINE_HEIGHT)
+
 class EditInvoiceWindow(tk.Toplevel):
     def __init__(self, parent, invoice_id):
         super().__init__(parent)
@@ -508,6 +700,7 @@ class StudentApp:
             file = service.files().create(body=file_metadata, media_body=media, fields='id').execute()
             service.permissions().create(fileId=file['id'], body={'type': 'anyone', 'role': 'reader'}).execute()
         
+        InvoicePDF.word_widths.clear()
         messagebox.showinfo("Success", "Invoices uploaded to Google Drive")
 
     def get_family_id(self, invoice_id):
@@ -515,15 +708,9 @@ class StudentApp:
         return cursor.fetchone()[0]
 
     def generate_pdf(self, invoice_id):
-        pdf = FPDF()
+        pdf = InvoicePDF()
         pdf.add_page()
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, txt="DoReMi Music School", ln=True, align='C')
-        pdf.set_font("Arial", size=12)
-        pdf.cell(200, 10, txt="302 Satellite Blvd NE, Ste#C225, Suwanee, GA 30024", ln=True, align='C')
-        pdf.cell(200, 10, txt="404-917-3348 | www.doremimusic.net", ln=True, align='C')
-        pdf.ln(10)
-        
+
         cursor.execute("SELECT family_id, month, year FROM invoices WHERE id=?", (invoice_id,))
         invoice = cursor.fetchone()
         family_id = invoice[0]
@@ -531,33 +718,23 @@ class StudentApp:
         cursor.execute("SELECT name FROM students WHERE family_id=?", (family_id,))
         students = [row[0] for row in cursor.fetchall()]
         students.sort()
-        pdf.cell(200, 10, txt=f"INVOICE for {', '.join(students)}", ln=True, align='C')
-        pdf.cell(200, 10, txt=f"Month: {invoice[1]}, Year: {invoice[2]}", ln=True, align='L')
+        pdf.cell(0, 10, txt=f"INVOICE for {', '.join(students)}", ln=True, align='C')
+        pdf.cell(0, 10, txt=f"Month: {invoice[1]}, Year: {invoice[2]}", ln=True, align='L')
         pdf.ln(10)
         
         cursor.execute("SELECT s.name, ii.date, ii.quantity, ii.rate, ii.amount, ii.description FROM invoice_items ii JOIN students s ON ii.student_id = s.id WHERE ii.invoice_id=?", (invoice_id,))
         items = cursor.fetchall()
-        pdf.cell(40, 10, txt="Student", border=1)
-        pdf.cell(30, 10, txt="Date", border=1)
-        pdf.cell(20, 10, txt="Qty", border=1)
-        pdf.cell(30, 10, txt="Rate", border=1)
-        pdf.cell(30, 10, txt="Amount", border=1)
-        pdf.cell(40, 10, txt="Description", border=1)
-        pdf.ln()
-        
+        rows = [(item[0], item[1], item[2], f"${item[3]:.2f}", f"${item[4]:.2f}", item[5] or "") for item in items]
+        pdf.start_table(rows[0] if rows else None)
+
         total_amount = 0
-        for item in items:
-            pdf.cell(40, 10, txt=item[0], border=1)
-            pdf.cell(30, 10, txt=item[1], border=1)
-            pdf.cell(20, 10, txt=str(item[2]), border=1)
-            pdf.cell(30, 10, txt=f"${item[3]:.2f}", border=1)
-            pdf.cell(30, 10, txt=f"${item[4]:.2f}", border=1)
-            pdf.cell(40, 10, txt=item[5], border=1)
-            pdf.ln()
+        for item, row in zip(items, rows):
+            pdf.add_row(row)
             total_amount += item[4]
-        
+        pdf.end_table()
+
         pdf.ln(10)
-        pdf.cell(200, 10, txt=f"Total: ${total_amount:.2f}", ln=True, align='R')
+        pdf.cell(0, 10, txt=f"Total: ${total_amount:.2f}", ln=True, align='R')
         return pdf
 
     def get_or_create_folder(self, service, folder_name):
@@ -604,6 +781,7 @@ class StudentApp:
             if not resp.json()['success']:
                 messagebox.showwarning("Warning", f"Failed to send SMS to {phone}")
         
+        InvoicePDF.word_widths.clear()
         messagebox.showinfo("Success", "SMS sent successfully")
 
     def delete_invoice(self):